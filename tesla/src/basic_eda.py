@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from typing import Optional
 
+from .tesla_data import _to_pandas
+
 
 # -------------------------------------------------------
 # 1) 기본 정보 요약
 # -------------------------------------------------------
 def summarize_dataframe(df: pd.DataFrame) -> None:
+    df = _to_pandas(df)
     print("=== DataFrame Shape ===")
     print(df.shape, "\n")
 
@@ -24,17 +28,22 @@ def summarize_dataframe(df: pd.DataFrame) -> None:
     print("=== Tail ===")
     print(df.tail(), "\n")
 
+    # 결측 마스크는 한 번만 계산
+    na_count = df.isna().sum()
+    na_ratio = (na_count / len(df) * 100).round(2)
+
     print("=== Missing Values ===")
-    print(df.isna().sum(), "\n")
+    print(na_count, "\n")
 
     print("=== Missing Ratio (%) ===")
-    print((df.isna().mean() * 100).round(2), "\n")
+    print(na_ratio, "\n")
 
 
 # -------------------------------------------------------
 # 2) 기술통계 (numeric 기준)
 # -------------------------------------------------------
 def numeric_stats(df: pd.DataFrame) -> pd.DataFrame:
+    df = _to_pandas(df)
     print("=== Numeric Summary Statistics ===")
     stats = df.describe().T
     print(stats)
@@ -45,6 +54,7 @@ def numeric_stats(df: pd.DataFrame) -> pd.DataFrame:
 # 3) 결측치 시각화
 # -------------------------------------------------------
 def plot_missing_values(df: pd.DataFrame) -> None:
+    df = _to_pandas(df)
     missing = df.isna().sum()
     missing = missing[missing > 0]
 
@@ -64,6 +74,7 @@ def plot_missing_values(df: pd.DataFrame) -> None:
 # 4) 카테고리컬 컬럼 value_counts
 # -------------------------------------------------------
 def count_categorical(df: pd.DataFrame, cols: list[str]) -> None:
+    df = _to_pandas(df)
     for col in cols:
         if col not in df.columns:
             print(f"[WARN] Column '{col}' not in DataFrame.")
@@ -78,8 +89,23 @@ def count_categorical(df: pd.DataFrame, cols: list[str]) -> None:
 # 5) 상관관계 Heatmap
 # -------------------------------------------------------
 def plot_corr_heatmap(df: pd.DataFrame) -> None:
+    df = _to_pandas(df)
+    # numeric_only=True와 같은 컬럼 집합 (bool 포함)
+    numeric = df.select_dtypes(include=["number", "bool"])
+    values = numeric.to_numpy(dtype=np.float64)
+
+    # 결측치가 없으면 np.corrcoef 한 번으로 계산, 있으면 pandas pairwise corr
+    if not np.isnan(values).any():
+        corr = pd.DataFrame(
+            np.corrcoef(values, rowvar=False),
+            index=numeric.columns,
+            columns=numeric.columns,
+        )
+    else:
+        corr = numeric.corr(method="pearson", min_periods=1)
+
     plt.figure(figsize=(10, 8))
-    sns.heatmap(df.corr(numeric_only=True), annot=False, cmap="coolwarm")
+    sns.heatmap(corr, annot=False, cmap="coolwarm")
     plt.title("Correlation Heatmap (Numeric Only)")
     plt.show()
 
@@ -87,10 +113,31 @@ def plot_corr_heatmap(df: pd.DataFrame) -> None:
 # -------------------------------------------------------
 # 6) 날짜(Year, Month) 분포
 # -------------------------------------------------------
+# 값이 [lo, hi] 범위의 작은 정수면 np.bincount, 아니면 value_counts로 fallback
+_BINCOUNT_MAX_SPAN = 100
+
+
+def _int_value_counts(
+    s: pd.Series,
+    lo: Optional[int] = None,
+    hi: Optional[int] = None,
+) -> pd.Series:
+    values = s.dropna().to_numpy()
+    if values.size and np.issubdtype(values.dtype, np.number) and np.all(values == np.round(values)):
+        ints = values.astype(np.int64)
+        lo = int(ints.min()) if lo is None else lo
+        hi = int(ints.max()) if hi is None else hi
+        if ints.min() >= lo and ints.max() <= hi and hi - lo < _BINCOUNT_MAX_SPAN:
+            counts = np.bincount(ints - lo, minlength=hi - lo + 1)
+            return pd.Series(counts, index=np.arange(lo, hi + 1))
+    return s.value_counts().sort_index()
+
+
 def plot_year_month_dist(df: pd.DataFrame) -> None:
+    df = _to_pandas(df)
     if "Year" in df.columns:
         plt.figure(figsize=(8, 3))
-        df["Year"].value_counts().sort_index().plot(kind="bar")
+        _int_value_counts(df["Year"]).plot(kind="bar")
         plt.title("Distribution by Year")
         plt.xlabel("Year")
         plt.ylabel("Count")
@@ -98,7 +145,7 @@ def plot_year_month_dist(df: pd.DataFrame) -> None:
 
     if "Month" in df.columns:
         plt.figure(figsize=(8, 3))
-        df["Month"].value_counts().sort_index().plot(kind="bar")
+        _int_value_counts(df["Month"], lo=1, hi=12).plot(kind="bar")
         plt.title("Distribution by Month")
         plt.xlabel("Month")
         plt.ylabel("Count")
@@ -108,7 +155,8 @@ def plot_year_month_dist(df: pd.DataFrame) -> None:
 # -------------------------------------------------------
 # 7) 기본적인 분포 그래프
 # -------------------------------------------------------
-def plot_basic_distributions(df: pd.DataFrame) -> None:
+def plot_basic_distributions(df: pd.DataFrame, kde: bool = True) -> None:
+    df = _to_pandas(df)
     numeric_cols = [
         "Estimated_Deliveries",
         "Production_Units",
@@ -117,14 +165,26 @@ def plot_basic_distributions(df: pd.DataFrame) -> None:
         "Range_km",
         "Charging_Stations",
     ]
+    cols = [col for col in numeric_cols if col in df.columns]
+    if not cols:
+        return
 
-    for col in numeric_cols:
-        if col not in df.columns:
-            continue
-
-        plt.figure(figsize=(8, 3))
-        sns.histplot(df[col], kde=True)
-        plt.title(f"Distribution: {col}")
-        plt.xlabel(col)
-        plt.grid(True, axis="y")
-        plt.show()
+    # 컬럼마다 figure를 만들지 않고 하나의 grid에 histogram을 그림 (y축은 count 유지)
+    fig, axes = plt.subplots(2, 3, figsize=(12, 8))
+    for ax, col in zip(axes.flat, cols):
+        # KDE는 gridsize를 제한해서 추가 (kde=False면 생략)
+        sns.histplot(
+            df[col],
+            ax=ax,
+            bins=50,
+            kde=kde,
+            kde_kws={"bw_method": "scott", "gridsize": 200},
+        )
+        ax.set_title(col)
+        ax.grid(True)
+    for ax in axes.flat[len(cols):]:
+        ax.set_visible(False)
+
+    plt.suptitle("Distributions (Numeric)")
+    plt.tight_layout()
+    plt.show()
@@ -1,18 +1,135 @@
+import hashlib
+import weakref
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    pa = None
+    pa_csv = None
+    _CSV_ENGINE = "c"
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# 컬럼별 dtype 지정 (dtype 추론 생략)
+TESLA_DTYPES: Dict[str, str] = {
+    "Year": "int16",
+    "Month": "int8",
+    "Region": "category",
+    "Model": "category",
+    "Estimated_Deliveries": "int32",
+    "Production_Units": "int32",
+    "Avg_Price_USD": "float32",
+    "Battery_Capacity_kWh": "float32",
+    "Range_km": "float32",
+    "Charging_Stations": "int32",
+}
+
+# polars backend용 스키마 (TESLA_DTYPES와 동일한 타입)
+POLARS_SCHEMA = (
+    {
+        "Year": pl.Int16,
+        "Month": pl.Int8,
+        "Region": pl.Categorical,
+        "Model": pl.Categorical,
+        "Estimated_Deliveries": pl.Int32,
+        "Production_Units": pl.Int32,
+        "Avg_Price_USD": pl.Float32,
+        "Battery_Capacity_kWh": pl.Float32,
+        "Range_km": pl.Float32,
+        "Charging_Stations": pl.Int32,
+    }
+    if pl is not None
+    else {}
+)
+
+# 공통: 지정한 컬럼 내용의 해시 (컬럼을 교체/수정하면 값이 바뀜)
+def _fingerprint(df, cols: List[str]) -> str:
+    if pl is not None and isinstance(df, pl.DataFrame):
+        row_hashes = df.select(cols).hash_rows().to_numpy()
+    else:
+        row_hashes = pd.util.hash_pandas_object(df[cols], index=True).to_numpy()
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+
+# 공통: 원본 df 기준 캐시 키
+# 행 수/컬럼 구성 + content_cols 내용 해시가 바뀌면 새로 계산 (컬럼 교체, 제자리 수정도 감지)
+def _cache_key(df, *extra, content_cols: List[str]) -> tuple:
+    return (
+        id(df),
+        df.shape[0],
+        tuple(sorted(map(str, df.columns))),
+        _fingerprint(df, content_cols),
+        *extra,
+    )
+
+# 공통: 캐시 저장 (값은 강하게 보관, 원본 df가 GC되면 weakref 콜백으로 제거)
+def _cache_put(cache: dict, key: tuple, owner, value) -> None:
+    if key not in cache:
+        weakref.finalize(owner, cache.pop, key, None)
+    cache[key] = value
+
+# polars df면 pandas로 변환 (plot 등 pandas 전용 코드 진입 시)
+def _to_pandas(df) -> pd.DataFrame:
+    if pl is not None and isinstance(df, pl.DataFrame):
+        return df.to_pandas()
+    return df
+
 # 정렬
 def load_tesla_data(
         csv_path: str | Path,
         sort: bool = True,
-) -> pd.DataFrame:
+        add_date: bool = True,
+        backend: str = "pandas",
+) -> Union[pd.DataFrame, "pl.DataFrame"]:
     csv_path = Path(csv_path)
-    df = pd.read_csv(csv_path)
+    if backend == "polars":
+        return _load_tesla_data_polars(csv_path, sort=sort, add_date=add_date)
+    if backend != "pandas":
+        raise ValueError(f"Unknown backend: {backend!r} (expected 'pandas' or 'polars')")
+
+    df = pd.read_csv(csv_path, dtype=TESLA_DTYPES, engine=_CSV_ENGINE)
 
     if sort:
         df = df.sort_values(["Year", "Month", "Region", "Model"]).reset_index(drop=True)
+    # Date는 로드 시 한 번만 계산 -> 이후 _prepare_ts_df에서 재계산하지 않음
+    if add_date:
+        df["Date"] = _make_date(df, "Year", "Month")
+    return df
+
+# polars backend 로드
+def _load_tesla_data_polars(
+        csv_path: Path,
+        sort: bool = True,
+        add_date: bool = True,
+) -> "pl.DataFrame":
+    if pl is None:
+        raise ImportError("backend='polars' requires the polars package.")
+
+    df = pl.read_csv(csv_path, schema_overrides=POLARS_SCHEMA)
+    if sort:
+        # Categorical은 물리 코드 순으로 정렬될 수 있어 문자열 기준으로 정렬
+        df = df.sort(
+            [
+                pl.col("Year"),
+                pl.col("Month"),
+                pl.col("Region").cast(pl.String),
+                pl.col("Model").cast(pl.String),
+            ],
+            maintain_order=True,
+        )
+    if add_date:
+        df = df.with_columns(
+            pl.datetime(pl.col("Year"), pl.col("Month"), 1).alias("Date")
+        )
     return df
 
 # Region 목록 추출
@@ -21,7 +138,16 @@ def get_region_names(
         region_col: str = "Region",
         sort: bool = True,
 ) -> List[str]:
-    regions = df[region_col].dropna().unique().tolist()
+    col = df[region_col]
+    if pl is not None and isinstance(df, pl.DataFrame):
+        regions = col.drop_nulls().unique().cast(pl.String).to_list()
+    elif isinstance(col.dtype, pd.CategoricalDtype):
+        # category: 코드(int) 기준으로 실제 등장한 카테고리만 추출
+        codes = col.cat.codes.to_numpy()
+        present = np.bincount(codes[codes >= 0], minlength=len(col.cat.categories)) > 0
+        regions = col.cat.categories[present].tolist()
+    else:
+        regions = col.dropna().unique().tolist()
     if sort:
         regions = sorted(regions)
     return regions
@@ -32,20 +158,51 @@ def split_by_region(
         region_col: str = "Region",
         drop_region_col: bool=True,
 ) -> Dict[str, pd.DataFrame]:
+    if pl is not None and isinstance(df, pl.DataFrame):
+        return _split_by_region_polars(df, region_col=region_col, drop_region_col=drop_region_col)
+
+    # 한 번 정렬 후 groupby로 분할 (region마다 전체 df를 스캔하지 않음)
+    df_sorted = df.sort_values([region_col, "Year", "Month"], kind="stable")
     region_dfs: Dict[str, pd.DataFrame] = {}
-    region_names = get_region_names(df, region_col=region_col, sort=True)
-    for region in region_names:
-        temp_df = df[df[region_col] == region].copy()
-        temp_df.sort_values(by=["Year", "Month"], inplace=True)
-        temp_df.reset_index(drop=True, inplace=True)
+    for region, temp_df in df_sorted.groupby(region_col, sort=True, observed=True):
+        temp_df = temp_df.reset_index(drop=True)
 
         if drop_region_col:
-            temp_df.drop(columns=region_col, inplace=True)
-        
+            temp_df = temp_df.drop(columns=region_col)
+
         region_dfs[region] = temp_df
 
     return region_dfs
 
+# Year/Month -> datetime (문자열 변환 없이 벡터화)
+def _make_date(
+        df: pd.DataFrame,
+        year_col: str,
+        month_col: str,
+) -> pd.Series:
+    return pd.to_datetime(
+        dict(
+            year=df[year_col].astype("int16"),
+            month=df[month_col].astype("int8"),
+            day=1,
+        )
+    )
+
+# polars: partition_by 한 번으로 분할
+def _split_by_region_polars(
+        df: "pl.DataFrame",
+        region_col: str = "Region",
+        drop_region_col: bool = True,
+) -> Dict[str, "pl.DataFrame"]:
+    df_sorted = df.filter(pl.col(region_col).is_not_null()).sort(["Year", "Month"], maintain_order=True)
+    parts = df_sorted.partition_by(
+        region_col,
+        as_dict=True,
+        include_key=not drop_region_col,
+        maintain_order=True,
+    )
+    return {str(key[0]): parts[key] for key in sorted(parts, key=lambda k: str(k[0]))}
+
 # date 지정 
 def add_date_column(
         df: pd.DataFrame,
@@ -53,14 +210,33 @@ def add_date_column(
         month_col: str = "Month",
         date_col: str = "Date"
 ) -> pd.DataFrame:
-    df = df.copy()
-    df[date_col] = pd.to_datetime(
-        df[year_col].astype(int).astype(str)
-        +"-"
-        +df[month_col].astype(int).astype(str)
-        +"-01"
-        )
-    return df
+    # 얕은 복사: 기존 컬럼 데이터는 공유, 새 컬럼 추가는 원본에 영향 없음
+    # (기존 컬럼을 제자리에서 수정하면 원본과 공유될 수 있음)
+    df_out = df.copy(deep=False)
+    df_out[date_col] = _make_date(df_out, year_col, month_col)
+    return df_out
+
+# Arrow CSV용 테이블 (index는 to_csv처럼 맨 앞 컬럼, 자정뿐인 날짜는 date로)
+def _arrow_table_for_csv(
+        rdf: pd.DataFrame,
+        index: bool = False,
+) -> "pa.Table":
+    if index:
+        rdf = rdf.rename_axis(rdf.index.name or "").reset_index()
+    table = pa.Table.from_pandas(rdf, preserve_index=False)
+    for i, col in enumerate(rdf.columns):
+        s = rdf[col]
+        if pd.api.types.is_datetime64_any_dtype(s) and (s.dropna() == s.dropna().dt.normalize()).all():
+            table = table.set_column(i, str(col), table.column(i).cast(pa.date32()))
+    return table
+
+# polars CSV용 df (자정뿐인 datetime 컬럼은 date로)
+def _polars_for_csv(rdf: "pl.DataFrame") -> "pl.DataFrame":
+    casts = []
+    for col, dtype in rdf.schema.items():
+        if dtype == pl.Datetime and (rdf[col].drop_nulls() == rdf[col].drop_nulls().dt.truncate("1d")).all():
+            casts.append(pl.col(col).cast(pl.Date))
+    return rdf.with_columns(casts) if casts else rdf
 
 # region별 csv 저장
 def save_region_dfs(
@@ -68,6 +244,7 @@ def save_region_dfs(
         out_dir: str|Path,
         prefix: str = "tesla_",
         index: bool=False,
+        parquet: bool = False,
 ) -> None:
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -80,5 +257,24 @@ def save_region_dfs(
             .replace(" ", "_")
             .replace("/", "_")
         )
-    out_path = out_dir / f"{prefix}{safe_region}.csv"
-    rdf.to_csv(out_path, index=index)
\ No newline at end of file
+        out_path = out_dir / f"{prefix}{safe_region}.csv"
+        # pyarrow가 있으면 pandas/polars 모두 Arrow CSV writer 사용 (pandas writer보다 빠름),
+        # 없으면 pandas는 to_csv, polars는 write_csv (두 writer의 출력은 동일).
+        # 어느 쪽이든 index는 맨 앞 컬럼(이름 없으면 빈 header), 자정뿐인 datetime 컬럼은 YYYY-MM-DD.
+        # pyarrow 유무에 따른 형식 차이:
+        #   - Arrow는 header와 문자열 값을 항상 따옴표로 감쌈 (읽으면 같은 값)
+        #   - Arrow는 정수값 float를 "60.0"이 아닌 "60"으로 씀 -> pd.read_csv로 읽으면
+        #     해당 컬럼(예: Battery_Capacity_kWh, Range_km)이 float64가 아닌 int64가 됨
+        is_polars = pl is not None and isinstance(rdf, pl.DataFrame)
+        if pa_csv is not None:
+            pdf = rdf.to_pandas() if is_polars else rdf
+            pa_csv.write_csv(_arrow_table_for_csv(pdf, index=index and not is_polars), out_path)
+        elif is_polars:
+            _polars_for_csv(rdf).write_csv(out_path)
+        else:
+            rdf.to_csv(out_path, index=index)
+
+        if parquet and is_polars:
+            rdf.write_parquet(out_path.with_suffix(".parquet"))
+        elif parquet:
+            rdf.to_parquet(out_path.with_suffix(".parquet"), index=index)
@@ -1,23 +1,188 @@
 from __future__ import annotations
-from typing import Optional, Tuple, Union, List
+import io
+from typing import Callable, Dict, Optional, Tuple, Union, List
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-from .tesla_data import add_date_column
+from matplotlib.figure import Figure
+from .tesla_data import _cache_key, _cache_put, _to_pandas, add_date_column
+
+# monthly_agg(engine="numba")로 명시할 때만 사용 (첫 호출 시 JIT 컴파일 비용 발생)
+_NUMBA_KWARGS = {"parallel": True, "nogil": True}
+
+try:
+    from joblib import Parallel, delayed
+except ImportError:
+    Parallel = None
+    delayed = None
 
 
 # 공통: Date 보장 + datetime 변환
+# 이미 준비된 df(Date가 datetime이고 정렬됨)는 그대로 반환 -> prepare_once 결과를 재사용
 def _prepare_ts_df(
     df: pd.DataFrame,
     date_col: str = "Date",
 ) -> pd.DataFrame:
+    df = _to_pandas(df)
     if date_col not in df.columns:
         df = add_date_column(df, date_col=date_col)
 
-    df[date_col] = pd.to_datetime(df[date_col])
-    df = df.sort_values(date_col).reset_index(drop=True)
+    if not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        # 포맷 지정으로 추론 경로 생략 (Arrow로 저장된 "YYYY-MM-DD HH:MM:SS"도 처리)
+        df[date_col] = pd.to_datetime(df[date_col], format="ISO8601", cache=True)
+    # 이미 날짜순이면 정렬/복사 생략
+    if not df[date_col].is_monotonic_increasing:
+        df = df.sort_values(date_col).reset_index(drop=True)
     return df
 
 
+# 공통: 월별 집계에 사용할 컬럼과 집계 함수
+MONTHLY_AGG_SPEC = {
+    "Estimated_Deliveries": "sum",
+    "Production_Units": "sum",
+    "Avg_Price_USD": "mean",
+    "Battery_Capacity_kWh": "mean",
+    "Range_km": "mean",
+    "Charging_Stations": "sum",
+}
+
+# monthly_agg 결과 캐시
+_MONTHLY_CACHE: Dict[tuple, pd.DataFrame] = {}
+
+
+# 공통: 여러 plot_* 함수에 넘길 df를 한 번만 준비
+# (결과를 plot_* 에 넘기면 각 함수의 _prepare_ts_df는 변환/정렬 없이 통과)
+def prepare_once(
+    df: pd.DataFrame,
+    date_col: str = "Date",
+) -> pd.DataFrame:
+    return _prepare_ts_df(df, date_col=date_col)
+
+
+# 공통: groupby 한 번으로 sum/mean 컬럼 집계 (engine="numba"면 numba 커널 사용)
+def _fused_monthly(
+    df: pd.DataFrame,
+    date_col: str = "Date",
+    engine: Optional[str] = None,
+) -> pd.DataFrame:
+    cols = [col for col in MONTHLY_AGG_SPEC if col in df.columns]
+    sum_cols = [col for col in cols if MONTHLY_AGG_SPEC[col] == "sum"]
+    mean_cols = [col for col in cols if MONTHLY_AGG_SPEC[col] == "mean"]
+    engine_kwargs = _NUMBA_KWARGS if engine == "numba" else None
+
+    # 결과 dtype 고정 (engine과 무관): 정수 합계는 int64, 나머지는 float64.
+    # float32 컬럼은 집계 전에 float64로 올려서 누적 오차 방지
+    out_dtypes = {
+        col: "int64"
+        if MONTHLY_AGG_SPEC[col] == "sum" and pd.api.types.is_integer_dtype(df[col])
+        else "float64"
+        for col in cols
+    }
+    upcast = {col: "float64" for col in cols if pd.api.types.is_float_dtype(df[col])}
+    if upcast:
+        df = df[[date_col] + cols].astype(upcast)
+
+    grouped = df.groupby(date_col, sort=True, observed=True)
+    parts = []
+    if sum_cols:
+        parts.append(grouped[sum_cols].sum(engine=engine, engine_kwargs=engine_kwargs))
+    if mean_cols:
+        parts.append(grouped[mean_cols].mean(engine=engine, engine_kwargs=engine_kwargs))
+    if not parts:
+        return pd.DataFrame(index=grouped.size().index)
+    return pd.concat(parts, axis=1)[cols].astype(out_dtypes)
+
+
+# 공통: 월별 집계를 한 번의 groupby로 계산 (plot_* 함수들이 공유, 캐시 객체를 그대로 반환하므로 내부 전용)
+def _monthly_cached(
+    df: pd.DataFrame,
+    date_col: str = "Date",
+    engine: Optional[str] = None,
+) -> pd.DataFrame:
+    # 집계에 쓰이는 컬럼(날짜 + MONTHLY_AGG_SPEC)만 내용 해시에 포함
+    date_cols = [date_col] if date_col in df.columns else ["Year", "Month"]
+    content_cols = date_cols + [col for col in MONTHLY_AGG_SPEC if col in df.columns]
+    key = _cache_key(df, date_col, engine, content_cols=content_cols)
+    cached = _MONTHLY_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    prepared = _prepare_ts_df(df, date_col=date_col)
+    monthly = _fused_monthly(prepared, date_col=date_col, engine=engine)
+
+    _cache_put(_MONTHLY_CACHE, key, df, monthly)
+    return monthly
+
+
+# 월별 집계 (캐시를 오염시키지 않도록 복사본 반환)
+# engine="numba"는 명시적 opt-in: 매우 큰 df에서만 이득, 결과 dtype/값은 기본 경로와 동일
+def monthly_agg(
+    df: pd.DataFrame,
+    date_col: str = "Date",
+    engine: Optional[str] = None,
+) -> pd.DataFrame:
+    return _monthly_cached(df, date_col=date_col, engine=engine).copy()
+
+
+# corr_matrix 결과 캐시
+_CORR_CACHE: Dict[tuple, pd.DataFrame] = {}
+
+
+# 공통: 월별 집계 df의 상관계수를 한 번에 계산 (plot_* 함수들이 공유, 내부 전용)
+def _corr_cached(
+    monthly_df: pd.DataFrame,
+) -> pd.DataFrame:
+    # 월별 df는 작으므로 전체 내용 기준으로 캐시
+    key = _cache_key(monthly_df, content_cols=list(monthly_df.columns))
+    cached = _CORR_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    corr = monthly_df.corr(method="pearson", numeric_only=True)
+
+    _cache_put(_CORR_CACHE, key, monthly_df, corr)
+    return corr
+
+
+# 상관계수 행렬 (캐시를 오염시키지 않도록 복사본 반환)
+def corr_matrix(
+    monthly_df: pd.DataFrame,
+) -> pd.DataFrame:
+    return _corr_cached(monthly_df).copy()
+
+
+# df.tesla.monthly / df.tesla.corr: 캐시된 월별 집계에 접근하는 accessor
+# (사용하는 컬럼 내용이 바뀌면 캐시 키가 달라져 다시 계산됨, 항상 복사본 반환)
+class TeslaAccessor:
+    def __init__(self, pandas_obj: pd.DataFrame) -> None:
+        self._obj = pandas_obj
+
+    @property
+    def prepared(self) -> pd.DataFrame:
+        return _prepare_ts_df(self._obj)
+
+    @property
+    def monthly(self) -> pd.DataFrame:
+        return monthly_agg(self._obj)
+
+    @property
+    def corr(self) -> pd.DataFrame:
+        return corr_matrix(_monthly_cached(self._obj))
+
+
+# importlib.reload 시 중복 등록 경고가 나지 않도록 한 번만 등록
+if not hasattr(pd.DataFrame, "tesla"):
+    pd.api.extensions.register_dataframe_accessor("tesla")(TeslaAccessor)
+
+
+# 공통: 긴 시계열에서는 marker 생략 (점마다 artist를 그리는 비용 방지)
+_MARKER_MAX_POINTS = 200
+
+
+def _marker(style: str, n_points: int) -> Optional[str]:
+    return style if n_points <= _MARKER_MAX_POINTS else None
+
+
 # 공통: 설명 출력용 헬퍼 --------------------------------------------
 def _print_description(
     title_kor: str,
@@ -45,8 +210,7 @@ def plot_monthly_deliveries(
     print_stats: bool = True,
     return_data: bool = False,
 ) -> Union[plt.Axes, Tuple[plt.Axes, pd.Series]]:
-    df = _prepare_ts_df(df, date_col=date_col)
-    monthly = df.groupby(date_col)["Estimated_Deliveries"].sum()
+    monthly = _monthly_cached(df, date_col=date_col)["Estimated_Deliveries"].copy()
 
     if explain:
         _print_description(
@@ -63,7 +227,12 @@ def plot_monthly_deliveries(
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 4))
 
-    ax.plot(monthly.index, monthly.values, marker="o")
+    # plot에는 float32 배열만 넘김 (통계/반환값은 원래 정밀도 유지)
+    ax.plot(
+        monthly.index.to_numpy(),
+        monthly.to_numpy(dtype=np.float32, copy=False),
+        marker=_marker("o", len(monthly)),
+    )
     title_region = f" - {region_name}" if region_name else ""
     ax.set_title(f"Monthly Estimated Deliveries{title_region}")
     ax.set_xlabel("Date")
@@ -94,11 +263,8 @@ def plot_production_vs_deliveries(
     print_stats: bool = True,
     return_data: bool = False,
 ) -> Union[plt.Axes, Tuple[plt.Axes, pd.DataFrame]]:
-    df = _prepare_ts_df(df, date_col=date_col)
-    monthly = (
-        df.groupby(date_col)[["Estimated_Deliveries", "Production_Units"]]
-        .sum()
-    )
+    full_monthly = _monthly_cached(df, date_col=date_col)
+    monthly = full_monthly[["Estimated_Deliveries", "Production_Units"]].copy()
 
     if explain:
         _print_description(
@@ -115,16 +281,17 @@ def plot_production_vs_deliveries(
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 4))
 
+    x = monthly.index.to_numpy()
     ax.plot(
-        monthly.index,
-        monthly["Estimated_Deliveries"],
-        marker="o",
+        x,
+        monthly["Estimated_Deliveries"].to_numpy(dtype=np.float32, copy=False),
+        marker=_marker("o", len(x)),
         label="Estimated Deliveries",
     )
     ax.plot(
-        monthly.index,
-        monthly["Production_Units"],
-        marker="s",
+        x,
+        monthly["Production_Units"].to_numpy(dtype=np.float32, copy=False),
+        marker=_marker("s", len(x)),
         linestyle="--",
         label="Production Units",
     )
@@ -138,7 +305,7 @@ def plot_production_vs_deliveries(
 
     if print_stats and not monthly.empty:
         ratio = monthly["Estimated_Deliveries"] / monthly["Production_Units"]
-        corr = monthly["Estimated_Deliveries"].corr(monthly["Production_Units"])
+        corr = _corr_cached(full_monthly).loc["Estimated_Deliveries", "Production_Units"]
         print("=== [Production vs Deliveries Stats]", title_region, "===")
         print(f"기간: {monthly.index.min().date()} ~ {monthly.index.max().date()}")
         print("평균 값:")
@@ -163,8 +330,7 @@ def plot_avg_price_ts(
     print_stats: bool = True,
     return_data: bool = False,
 ) -> Union[plt.Axes, Tuple[plt.Axes, pd.Series]]:
-    df = _prepare_ts_df(df, date_col=date_col)
-    monthly_price = df.groupby(date_col)["Avg_Price_USD"].mean()
+    monthly_price = _monthly_cached(df, date_col=date_col)["Avg_Price_USD"].copy()
 
     if explain:
         _print_description(
@@ -181,7 +347,11 @@ def plot_avg_price_ts(
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 4))
 
-    ax.plot(monthly_price.index, monthly_price.values, marker="o")
+    ax.plot(
+        monthly_price.index.to_numpy(),
+        monthly_price.to_numpy(dtype=np.float32, copy=False),
+        marker=_marker("o", len(monthly_price)),
+    )
     title_region = f" - {region_name}" if region_name else ""
     ax.set_title(f"Average Price Over Time{title_region}")
     ax.set_xlabel("Date")
@@ -212,13 +382,18 @@ def plot_model_share_ts(
     return_data: bool = False,
 ) -> Union[plt.Axes, Tuple[plt.Axes, pd.DataFrame]]:
     df = _prepare_ts_df(df, date_col=date_col)
-    pivot = (
-        df.groupby([date_col, "Model"])["Estimated_Deliveries"]
-        .sum()
-        .unstack("Model")
-        .fillna(0.0)
+    pivot = df.pivot_table(
+        index=date_col,
+        columns="Model",
+        values="Estimated_Deliveries",
+        aggfunc="sum",
+        fill_value=0.0,
+        observed=True,
     )
-    share = pivot.div(pivot.sum(axis=1), axis=0)
+    # 점유율 정규화는 numpy에서 한 번에 (float32로 충분)
+    arr = pivot.to_numpy(dtype=np.float32, copy=False)
+    share_arr = arr / arr.sum(axis=1, keepdims=True)
+    share = pd.DataFrame(share_arr, index=pivot.index, columns=pivot.columns)
 
     if explain:
         _print_description(
@@ -235,7 +410,14 @@ def plot_model_share_ts(
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 4))
 
-    ax.stackplot(share.index, share.T.values, labels=share.columns)
+    values = np.ascontiguousarray(share.to_numpy(dtype=np.float32).T)
+    colors = plt.cm.tab20(np.linspace(0, 1, len(share.columns)))
+    ax.stackplot(
+        share.index.to_numpy(),
+        values,
+        labels=share.columns.to_list(),
+        colors=colors,
+    )
 
     title_region = f" - {region_name}" if region_name else ""
     ax.set_title(f"Model Market Share Over Time{title_region}")
@@ -268,12 +450,8 @@ def plot_battery_and_range_ts(
     print_stats: bool = True,
     return_data: bool = False,
 ) -> Union[plt.Axes, Tuple[plt.Axes, pd.DataFrame]]:
-    df = _prepare_ts_df(df, date_col=date_col)
-
-    monthly = (
-        df.groupby(date_col)[["Battery_Capacity_kWh", "Range_km"]]
-        .mean()
-    )
+    full_monthly = _monthly_cached(df, date_col=date_col)
+    monthly = full_monthly[["Battery_Capacity_kWh", "Range_km"]].copy()
 
     if explain:
         _print_description(
@@ -290,11 +468,12 @@ def plot_battery_and_range_ts(
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 4))
 
+    x = monthly.index.to_numpy()
     # 1번째 y축: Battery
     ax.plot(
-        monthly.index,
-        monthly["Battery_Capacity_kWh"],
-        marker="o",
+        x,
+        monthly["Battery_Capacity_kWh"].to_numpy(dtype=np.float32, copy=False),
+        marker=_marker("o", len(x)),
         label="Battery Capacity (kWh)",
     )
     ax.set_ylabel("Battery Capacity (kWh)")
@@ -303,9 +482,9 @@ def plot_battery_and_range_ts(
     # 2번째 y축: Range
     ax2 = ax.twinx()
     ax2.plot(
-        monthly.index,
-        monthly["Range_km"],
-        marker="s",
+        x,
+        monthly["Range_km"].to_numpy(dtype=np.float32, copy=False),
+        marker=_marker("s", len(x)),
         linestyle="--",
         label="Range (km)",
     )
@@ -321,7 +500,7 @@ def plot_battery_and_range_ts(
     ax.legend(lines_1 + lines_2, labels_1 + labels_2, loc="upper left")
 
     if print_stats and not monthly.empty:
-        corr = monthly["Battery_Capacity_kWh"].corr(monthly["Range_km"])
+        corr = _corr_cached(full_monthly).loc["Battery_Capacity_kWh", "Range_km"]
         print("=== [Battery & Range Stats]", title_region, "===")
         print(f"기간: {monthly.index.min().date()} ~ {monthly.index.max().date()}")
         print("평균 값:")
@@ -345,12 +524,8 @@ def plot_infra_vs_sales_ts(
     print_stats: bool = True,
     return_data: bool = False,
 ) -> Union[plt.Axes, Tuple[plt.Axes, pd.DataFrame]]:
-    df = _prepare_ts_df(df, date_col=date_col)
-
-    monthly = (
-        df.groupby(date_col)[["Estimated_Deliveries", "Charging_Stations"]]
-        .sum()
-    )
+    full_monthly = _monthly_cached(df, date_col=date_col)
+    monthly = full_monthly[["Estimated_Deliveries", "Charging_Stations"]].copy()
 
     if explain:
         _print_description(
@@ -367,11 +542,12 @@ def plot_infra_vs_sales_ts(
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 4))
 
+    x = monthly.index.to_numpy()
     # 판매량: 왼쪽 y축
     ax.plot(
-        monthly.index,
-        monthly["Estimated_Deliveries"],
-        marker="o",
+        x,
+        monthly["Estimated_Deliveries"].to_numpy(dtype=np.float32, copy=False),
+        marker=_marker("o", len(x)),
         label="Estimated Deliveries",
     )
     ax.set_ylabel("Estimated Deliveries")
@@ -380,9 +556,9 @@ def plot_infra_vs_sales_ts(
     # 충전소 수: 오른쪽 y축
     ax2 = ax.twinx()
     ax2.plot(
-        monthly.index,
-        monthly["Charging_Stations"],
-        marker="s",
+        x,
+        monthly["Charging_Stations"].to_numpy(dtype=np.float32, copy=False),
+        marker=_marker("s", len(x)),
         linestyle="--",
         label="Charging Stations",
     )
@@ -397,7 +573,7 @@ def plot_infra_vs_sales_ts(
     ax.legend(lines_1 + lines_2, labels_1 + labels_2, loc="upper left")
 
     if print_stats and not monthly.empty:
-        corr = monthly["Estimated_Deliveries"].corr(monthly["Charging_Stations"])
+        corr = _corr_cached(full_monthly).loc["Estimated_Deliveries", "Charging_Stations"]
         print("=== [Infrastructure vs Sales Stats]", title_region, "===")
         print(f"기간: {monthly.index.min().date()} ~ {monthly.index.max().date()}")
         print("평균 값:")
@@ -409,3 +585,80 @@ def plot_infra_vs_sales_ts(
     if return_data:
         return ax, monthly
     return ax
+
+
+# 7) 대시보드: 6개 그래프를 하나의 figure에 ------------------------
+def plot_dashboard(
+    df: pd.DataFrame,
+    region_name: Optional[str] = None,
+    date_col: str = "Date",
+    explain: bool = False,
+    print_stats: bool = False,
+) -> plt.Figure:
+    df = _prepare_ts_df(df, date_col=date_col)
+
+    fig, axes = plt.subplots(3, 2, figsize=(16, 12))
+    plot_fns = [
+        plot_monthly_deliveries,
+        plot_production_vs_deliveries,
+        plot_avg_price_ts,
+        plot_model_share_ts,
+        plot_battery_and_range_ts,
+        plot_infra_vs_sales_ts,
+    ]
+    for plot_fn, ax in zip(plot_fns, axes.flat):
+        plot_fn(
+            df,
+            region_name=region_name,
+            date_col=date_col,
+            ax=ax,
+            explain=explain,
+            print_stats=print_stats,
+        )
+
+    fig.tight_layout()
+    plt.show()
+    return fig
+
+
+# 8) region별 그래프 병렬 렌더링 -----------------------------------
+# worker: pyplot/백엔드를 거치지 않고 Figure를 직접 만들어 PNG bytes로 반환
+def _render_png(
+    region_name: str,
+    rdf: pd.DataFrame,
+    plot_fn: Callable[..., plt.Axes],
+) -> Tuple[str, bytes]:
+    fig = Figure(figsize=(10, 4))
+    ax = fig.add_subplot()
+    plot_fn(rdf, region_name, ax=ax, explain=False, print_stats=False)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight")
+    return region_name, buf.getvalue()
+
+
+def plot_all_regions(
+    region_dfs: Dict[str, pd.DataFrame],
+    plot_fn: Callable[..., plt.Axes],
+    n_jobs: int = 1,
+    display: bool = True,
+) -> Dict[str, bytes]:
+    # 기본은 순차 렌더링: worker 시작(프로세스 + import) 비용이 region 하나 그리는 비용보다 큼.
+    # region당 데이터가 매우 클 때만 n_jobs > 1 (또는 -1) 지정. joblib이 없으면 항상 순차.
+    if Parallel is None or n_jobs == 1:
+        results = [_render_png(r, rdf, plot_fn) for r, rdf in region_dfs.items()]
+    else:
+        results = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_render_png)(r, rdf, plot_fn) for r, rdf in region_dfs.items()
+        )
+    images = dict(results)
+
+    if display:
+        try:
+            from IPython.display import Image, display as ipy_display
+        except ImportError:
+            pass
+        else:
+            for png in images.values():
+                ipy_display(Image(data=png))
+    return images